@@ -4,25 +4,75 @@
 读取外置存储卡，分析视频素材文件名，提取卷号并重命名存储卡
 """
 
+import bisect
 import json
+import mmap
 import os
+import plistlib
 import re
 import subprocess
 import threading
+import time
 import queue
+from concurrent.futures import ThreadPoolExecutor
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
 from pathlib import Path
 from collections import defaultdict
 import xml.etree.ElementTree as ET
 
+# 可选加速：装有orjson时用其C实现读写配置，缺省回退标准库json
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # 常量配置
 DEFAULT_CONFIG_FILE = Path.home() / '.card_renamer_settings.json'
 
-# 视频文件扩展名
-VIDEO_EXTENSIONS = {'.mxf', '.mov', '.mp4', '.r3d', '.ari', '.braw'}
+# 视频文件扩展名（小写、不含点，配合快速后缀判断）
+VIDEO_EXTENSIONS = frozenset({'mxf', 'mov', 'mp4', 'r3d', 'ari', 'braw'})
 REEL_PATTERN = re.compile(r'([A-Z]\d{3})')
+REEL_PATTERN_BYTES = re.compile(rb'([A-Z]\d{3})')
+# 按长度分桶的后缀集合（含点），只需小写文件名末尾的4~5个字符
+VIDEO_SUFFIXES_4 = frozenset('.' + ext for ext in VIDEO_EXTENSIONS if len(ext) == 3)
+VIDEO_SUFFIXES_5 = frozenset('.' + ext for ext in VIDEO_EXTENSIONS if len(ext) == 4)
 STEPS = ['刷新', '分析', '重命名', '推出']
+# 扫描时最多保留的示例文件名数量
+VIDEO_SAMPLE_LIMIT = 3
+# 快速模式：连续多少个文件未出现新卷号后提前结束扫描
+FAST_SCAN_STREAK = 500
+# 工作日志最多保留的行数
+LOG_MAX_LINES = 500
+# diskutil重命名/推出操作的统一超时（秒）
+DISKUTIL_TIMEOUT = 30
+
+# 扫描时跳过的系统目录（隐藏目录按'.'前缀统一跳过）
+SKIP_DIRS = frozenset({'System Volume Information', '$RECYCLE.BIN'})
+
+
+def iter_files(root, on_error=None):
+    """基于os.scandir的迭代遍历，避免os.walk的额外stat调用"""
+    stack = [str(root)]
+    while stack:
+        path = stack.pop()
+        try:
+            with os.scandir(path) as it:
+                for entry in it:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            name = entry.name
+                            if name[0] != '.' and name not in SKIP_DIRS:
+                                stack.append(entry.path)
+                        else:
+                            yield entry
+                    except OSError:
+                        continue
+        except PermissionError:
+            if on_error:
+                on_error(path)
+        except OSError:
+            continue
 
 # 元数据配置
 METADATA_CONFIG = [
@@ -49,6 +99,20 @@ METADATA_CONFIG = [
 ]
 
 
+def _build_metadata_probes():
+    """启动时把METADATA_CONFIG展平为(品牌, 类型, 目标, 配置)探测列表"""
+    probes = []
+    for config in METADATA_CONFIG:
+        for filename in config.get('files', []):
+            probes.append((config['name'], 'file', filename, config))
+        if 'pattern' in config:
+            probes.append((config['name'], 'pattern', config['pattern'], config))
+    return probes
+
+
+METADATA_PROBES = _build_metadata_probes()
+
+
 class CardRenamerApp:
     def __init__(self, root):
         self.root = root
@@ -61,21 +125,39 @@ class CardRenamerApp:
         self.config_file = Path(self.settings.get('config_path', str(Path.home() / '.card_renamer_config.json')))
         
         # 状态变量
-        self.video_files = []
+        self.video_file_count = 0
+        self.video_sample = []
         self.reel_numbers = set()
         self.selected_volume = tk.StringVar()
         self.selected_reel = tk.StringVar()
         self.volume_paths = {}
         self.current_step = 0
+        self._fast_mode = False
+        self._names_need_reels = True
+        self._vols_cache = (None, {})
+        self._disk_id_cache = {}
+        self._meta_cache = {}
+        self._history_rendered = None
+        self._history_refresh_scheduled = False
         
         # 加载配置（包含last_reel和reel_history）
         self.config = self.load_config()
+        self._saved_config = dict(self.config)
+        self._written_config = dict(self.config)
         self.last_reel = self.config.get('last_reel', '')
         self.reel_history = set(self.config.get('reel_history', []))
+        self._groups = self._build_groups()
         
         # 日志队列
         self.log_queue = queue.Queue()
+
+        # 配置写盘队列（后台线程串行落盘，避免阻塞UI）
+        self._save_queue = queue.Queue()
+        self._save_lock = threading.Lock()
+        threading.Thread(target=self._config_writer, daemon=True).start()
         
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
+
         self.setup_ui()
         self.refresh_volumes()
         self.update_history_table()
@@ -137,6 +219,11 @@ class CardRenamerApp:
         
         self.analyze_btn = ttk.Button(row1, text="分析存储卡", command=self.do_analysis, width=12)
         self.analyze_btn.pack(side=tk.RIGHT)
+
+        # 快速模式：卷号稳定后提前结束扫描
+        self.fast_scan = tk.BooleanVar(value=False)
+        self.fast_check = ttk.Checkbutton(row1, text="快速模式", variable=self.fast_scan)
+        self.fast_check.pack(side=tk.RIGHT, padx=(0, 8))
         
         row2 = ttk.Frame(result_frame)
         row2.pack(fill=tk.X, pady=(0, 5))
@@ -179,28 +266,23 @@ class CardRenamerApp:
         table_container = ttk.Frame(history_frame)
         table_container.pack(fill=tk.BOTH, expand=True)
         
-        # Canvas + 滚动条
-        self.table_canvas = tk.Canvas(table_container, height=80, bg="white", 
-                                       highlightthickness=1, highlightbackground="#ddd")
-        
+        # Treeview + 滚动条（布局与滚动交给Tk的C实现）
+        self.history_tree = ttk.Treeview(table_container, show='headings', height=4)
+
         # 垂直滚动条
-        v_scrollbar = ttk.Scrollbar(table_container, orient=tk.VERTICAL, 
-                                     command=self.table_canvas.yview)
+        v_scrollbar = ttk.Scrollbar(table_container, orient=tk.VERTICAL,
+                                     command=self.history_tree.yview)
         # 水平滚动条
-        h_scrollbar = ttk.Scrollbar(history_frame, orient=tk.HORIZONTAL, 
-                                     command=self.table_canvas.xview)
-        
-        self.table_canvas.configure(yscrollcommand=v_scrollbar.set, 
+        h_scrollbar = ttk.Scrollbar(history_frame, orient=tk.HORIZONTAL,
+                                     command=self.history_tree.xview)
+
+        self.history_tree.configure(yscrollcommand=v_scrollbar.set,
                                      xscrollcommand=h_scrollbar.set)
-        
-        self.table_canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+
+        self.history_tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         v_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
         h_scrollbar.pack(fill=tk.X)
         
-        # 绑定鼠标滚轮
-        self.table_canvas.bind('<MouseWheel>', self._on_canvas_scroll)
-        self.table_canvas.bind('<Enter>', lambda e: self.table_canvas.focus_set())
-        
         # 清除历史按钮和设置按钮
         btn_frame = ttk.Frame(history_frame)
         btn_frame.pack(fill=tk.X, pady=(5, 0))
@@ -247,75 +329,74 @@ class CardRenamerApp:
         self.log_text.bind('<MouseWheel>', self._on_log_scroll)
         self.log_text.bind('<Enter>', lambda e: self.log_text.focus_set())
     
-    def _on_canvas_scroll(self, event):
-        """处理Canvas鼠标滚轮事件"""
-        self.table_canvas.yview_scroll(int(-1 * (event.delta / 120)), "units")
-    
     def _on_log_scroll(self, event):
         """处理日志区域鼠标滚轮事件"""
         self.log_text.yview_scroll(int(-1 * (event.delta / 120)), "units")
     
     def update_history_table(self):
-        """更新卷号历史表格"""
-        self.table_canvas.delete("all")
-        
+        """更新卷号历史表格（列结构不变时仅增量更新单元格）"""
+        tree = self.history_tree
+
         if not self.reel_history:
-            self.table_canvas.create_text(280, 40, text="暂无历史记录", 
-                                           fill="#999", font=("Arial", 12))
+            tree.delete(*tree.get_children())
+            tree.configure(columns=('empty',))
+            tree.heading('empty', text='')
+            tree.column('empty', width=540, anchor=tk.CENTER)
+            tree.insert('', tk.END, values=('暂无历史记录',))
             self.history_count_label.config(text="共 0 个卷号")
-            self.table_canvas.configure(scrollregion=(0, 0, 560, 80))
+            self._history_rendered = None
             return
-        
-        # 按字母分组并排序
-        groups = defaultdict(list)
-        for reel in self.reel_history:
-            letter = reel[0]  # 首字母 A, B, C...
-            groups[letter].append(reel)
-        
-        # 对每组内按数字排序
-        for letter in groups:
-            groups[letter].sort(key=lambda x: int(x[1:]))
-        
+
+        # 分组缓存随历史记录增量维护，刷新时无需重排
+        groups = self._groups
+
         # 按字母ASCII顺序排列列
         sorted_letters = sorted(groups.keys())
-        
-        # 绘制表格
-        col_width = 70
-        row_height = 20
-        padding = 10
-        header_height = 25
-        
-        # 计算需要的尺寸
-        canvas_width = len(sorted_letters) * col_width + padding * 2
-        max_rows = max(len(v) for v in groups.values()) if groups else 0
-        content_height = header_height + max_rows * row_height + 10
-        
-        # 绘制表头和数据
-        for col_idx, letter in enumerate(sorted_letters):
-            x = padding + col_idx * col_width + col_width // 2
-            
-            # 表头
-            self.table_canvas.create_text(x, 12, text=letter, 
-                                           font=("Arial", 12, "bold"), fill="#333")
-            
-            # 分隔线
-            self.table_canvas.create_line(
-                padding + col_idx * col_width, header_height,
-                padding + (col_idx + 1) * col_width, header_height,
-                fill="#ddd"
-            )
-            
-            # 数据行
-            for row_idx, reel in enumerate(groups[letter]):
-                y = header_height + 5 + row_idx * row_height + row_height // 2
-                self.table_canvas.create_text(x, y, text=reel, 
-                                               font=("Monaco", 10), fill="#007AFF")
-        
+        max_rows = max(len(v) for v in groups.values())
+
+        rendered = self._history_rendered
+        if rendered and rendered[0] == sorted_letters:
+            # 常见路径（新增单个卷号）：只改动受影响的单元格
+            prev_groups = rendered[1]
+            items = list(tree.get_children())
+            for _ in range(max_rows - len(items)):
+                items.append(tree.insert('', tk.END, values=('',) * len(sorted_letters)))
+            for item in items[max_rows:]:
+                tree.delete(item)
+            items = items[:max_rows]
+
+            tree_set = tree.set  # 循环内避免重复方法查找
+            for letter in sorted_letters:
+                col = groups[letter]
+                prev = prev_groups.get(letter, [])
+                if col == prev:
+                    continue
+                for row_idx, item in enumerate(items):
+                    value = col[row_idx] if row_idx < len(col) else ''
+                    prev_value = prev[row_idx] if row_idx < len(prev) else ''
+                    if value != prev_value:
+                        tree_set(item, letter, value)
+        else:
+            # 列结构变化时整表重建
+            tree.delete(*tree.get_children())
+            tree.configure(columns=tuple(sorted_letters))
+            for letter in sorted_letters:
+                tree.heading(letter, text=letter)
+                tree.column(letter, width=70, anchor=tk.CENTER, stretch=False)
+
+            # 每行汇集各字母列对应序号的卷号
+            insert = tree.insert
+            end = tk.END
+            for row_idx in range(max_rows):
+                values = tuple(groups[letter][row_idx] if row_idx < len(groups[letter]) else ''
+                               for letter in sorted_letters)
+                insert('', end, values=values)
+
+        # 快照需复制各列表，增量维护会原地修改分组缓存
+        self._history_rendered = (sorted_letters, {k: list(v) for k, v in groups.items()})
+
         # 更新计数
         self.history_count_label.config(text=f"共 {len(self.reel_history)} 个卷号")
-        
-        # 设置滚动区域（内容区域大小）
-        self.table_canvas.configure(scrollregion=(0, 0, max(canvas_width, 560), content_height))
     
     def clear_history(self):
         """清除历史记录"""
@@ -324,18 +405,43 @@ class CardRenamerApp:
         
         if messagebox.askyesno("确认", "确定要清除所有卷号历史记录吗？"):
             self.reel_history.clear()
+            self._groups.clear()
             self.save_config()
-            self.update_history_table()
+            self.schedule_history_refresh()
             self.log("已清除卷号历史记录")
     
     def check_reel_duplicate(self, reel):
         """检查卷号是否已存在于历史中"""
         return reel in self.reel_history
     
+    def _build_groups(self):
+        """从历史记录构建按首字母分组、组内按数字排序的映射"""
+        groups = defaultdict(list)
+        for reel in self.reel_history:
+            groups[reel[0]].append(reel)
+        for letter in groups:
+            groups[letter].sort(key=lambda x: int(x[1:]))
+        return groups
+
     def add_reel_to_history(self, reel):
         """添加卷号到历史记录"""
-        self.reel_history.add(reel)
+        if reel not in self.reel_history:
+            self.reel_history.add(reel)
+            # 增量维护分组缓存，避免刷新时整体重排
+            bisect.insort(self._groups[reel[0]], reel, key=lambda x: int(x[1:]))
         self.save_config()
+        self.schedule_history_refresh()
+
+    def schedule_history_refresh(self):
+        """合并突发的表格刷新请求，每个空闲周期只重绘一次"""
+        if self._history_refresh_scheduled:
+            return
+        self._history_refresh_scheduled = True
+        self.root.after_idle(self._refresh_history_now)
+
+    def _refresh_history_now(self):
+        """执行被合并的表格刷新"""
+        self._history_refresh_scheduled = False
         self.update_history_table()
     
     def set_step(self, step_index, status='active'):
@@ -374,12 +480,16 @@ class CardRenamerApp:
         
         if messages:
             self.log_text.config(state=tk.NORMAL)
-            for msg in messages:
-                self.log_text.insert(tk.END, msg + "\n")
+            self.log_text.insert(tk.END, "\n".join(messages) + "\n")
+            # 超出上限时丢弃最早的行，保持日志开销恒定
+            total = int(self.log_text.index('end-1c').split('.')[0])
+            if total > LOG_MAX_LINES:
+                self.log_text.delete('1.0', f'{total - LOG_MAX_LINES + 1}.0')
             self.log_text.see(tk.END)
             self.log_text.config(state=tk.DISABLED)
-        
-        self.root.after(100, self.process_log_queue)
+
+        # 有消息时加快轮询，空闲时放慢，减少无谓唤醒
+        self.root.after(50 if messages else 250, self.process_log_queue)
     
     def log(self, message):
         """线程安全日志"""
@@ -395,18 +505,28 @@ class CardRenamerApp:
         """加载JSON文件"""
         try:
             if filepath.exists():
-                with open(filepath, 'r', encoding='utf-8') as f:
-                    return json.load(f)
+                raw = filepath.read_bytes()
+                if orjson is not None:
+                    return orjson.loads(raw)
+                return json.loads(raw)
         except Exception:
             pass
         return default.copy()
     
     def _save_json_file(self, filepath, data):
-        """保存JSON文件"""
+        """保存JSON文件（先写临时文件再原子替换，避免中途崩溃截断）"""
         try:
-            filepath.parent.mkdir(parents=True, exist_ok=True)
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
+            # 串行化写盘：退出时的同步写可能与后台写线程并发
+            with self._save_lock:
+                filepath.parent.mkdir(parents=True, exist_ok=True)
+                if orjson is not None:
+                    payload = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+                else:
+                    payload = json.dumps(data, ensure_ascii=False, indent=2).encode('utf-8')
+                tmp = filepath.with_suffix(filepath.suffix + '.tmp')
+                with open(tmp, 'wb') as f:
+                    f.write(payload)
+                os.replace(tmp, filepath)
         except Exception as e:
             self.log(f"保存文件失败: {e}")
     
@@ -415,10 +535,35 @@ class CardRenamerApp:
         return self._load_json_file(self.config_file)
     
     def save_config(self):
-        """保存配置"""
+        """保存配置（快照交由后台线程写盘，未变化时跳过）"""
         self.config['last_reel'] = self.last_reel
-        self.config['reel_history'] = list(self.reel_history)
-        self._save_json_file(self.config_file, self.config)
+        self.config['reel_history'] = sorted(self.reel_history)
+        if self.config == self._saved_config:
+            return
+        self._saved_config = dict(self.config)
+        self._save_queue.put((self.config_file, self._saved_config))
+
+    def _config_writer(self):
+        """后台配置写盘线程：短暂等待合并连续请求，只落盘最新快照"""
+        while True:
+            filepath, data = self._save_queue.get()
+            time.sleep(0.5)  # 给紧随其后的写请求留出合并窗口
+            try:
+                while True:
+                    filepath, data = self._save_queue.get_nowait()
+            except queue.Empty:
+                pass
+            self._save_json_file(filepath, data)
+            self._written_config = data
+
+    def on_close(self):
+        """退出前同步写出尚未落盘的配置"""
+        # 待写快照可能正被写线程持有（合并窗口内），不能依赖队列判断，
+        # 直接对比最近一次落盘的内容
+        if self._saved_config != self._written_config:
+            self._save_json_file(self.config_file, self._saved_config)
+            self._written_config = self._saved_config
+        self.root.destroy()
     
     def load_settings(self):
         """加载用户设置"""
@@ -465,17 +610,45 @@ class CardRenamerApp:
         self.last_reel_label.config(text=reel)
         self.save_config()
     
+    def _load_disk_identifiers(self):
+        """用一次diskutil list -plist预填卷名到磁盘标识符的映射"""
+        try:
+            result = subprocess.run(
+                ['diskutil', 'list', '-plist'],
+                capture_output=True, timeout=10
+            )
+            if result.returncode != 0:
+                return
+            info = plistlib.loads(result.stdout)
+            for disk in info.get('AllDisksAndPartitions', []):
+                parts = disk.get('Partitions', []) + disk.get('APFSVolumes', [])
+                for part in parts or [disk]:
+                    mount = part.get('MountPoint')
+                    device = part.get('DeviceIdentifier')
+                    if mount and device and mount.startswith('/Volumes/'):
+                        self._disk_id_cache[mount[len('/Volumes/'):]] = device
+        except Exception:
+            pass
+
     def get_disk_identifier(self, volume_name):
-        """获取磁盘标识符"""
+        """获取磁盘标识符（结果缓存，避免重复subprocess）"""
+        if volume_name in self._disk_id_cache:
+            return self._disk_id_cache[volume_name]
         try:
             result = subprocess.run(
                 ['diskutil', 'info', f'/Volumes/{volume_name}'],
                 capture_output=True, text=True, timeout=10
             )
             if result.returncode == 0:
-                for line in result.stdout.split('\n'):
-                    if 'Device Identifier:' in line:
-                        return line.split(':')[1].strip()
+                # 直接定位目标字段，避免整份输出按行拆分
+                marker = 'Device Identifier:'
+                start = result.stdout.find(marker)
+                if start >= 0:
+                    start += len(marker)
+                    end = result.stdout.find('\n', start)
+                    disk_id = result.stdout[start:end if end >= 0 else None].strip()
+                    self._disk_id_cache[volume_name] = disk_id
+                    return disk_id
         except Exception:
             pass
         return None
@@ -483,68 +656,148 @@ class CardRenamerApp:
     def extract_reel_from_metadata(self, volume_path):
         """从元数据文件中提取卷号"""
         reel_numbers = set()
-        
-        for config in METADATA_CONFIG:
+
+        # 一次列出根目录，代替对每个候选元数据文件单独exists()探测
+        try:
+            root_names = set(os.listdir(volume_path))
+        except OSError:
+            root_names = set()
+
+        for brand, kind, target, config in METADATA_PROBES:
             # 处理指定文件名
-            if 'files' in config:
-                for filename in config['files']:
-                    filepath = volume_path / filename
-                    if filepath.exists():
-                        self.log(f"找到{config['name']}元数据: {filename}")
-                        reel_numbers.update(self._parse_xml_metadata(filepath, config['tags']))
-            
+            if kind == 'file':
+                if target in root_names:
+                    filepath = volume_path / target
+                    self.log(f"找到{brand}元数据: {target}")
+                    reel_numbers.update(self._parse_metadata_cached(filepath, config))
+
             # 处理文件模式
-            elif 'pattern' in config:
-                files = list(volume_path.glob(config['pattern']))
-                for filepath in files:
-                    self.log(f"找到{config['name']}元数据: {filepath.name}")
-                    if config.get('is_text'):
-                        reel_numbers.update(self._parse_text_metadata(filepath))
-                    else:
-                        reel_numbers.update(self._parse_xml_metadata(filepath, config['tags']))
+            else:
+                for filepath in volume_path.glob(target):
+                    self.log(f"找到{brand}元数据: {filepath.name}")
+                    reel_numbers.update(self._parse_metadata_cached(filepath, config))
         
         return reel_numbers
     
+    def _parse_metadata_cached(self, filepath, config):
+        """按(路径, mtime)缓存元数据解析结果，重复分析同一张卡免于重读"""
+        try:
+            key = (str(filepath), filepath.stat().st_mtime_ns)
+        except OSError:
+            key = None
+        if key is not None and key in self._meta_cache:
+            return self._meta_cache[key]
+
+        if config.get('is_text'):
+            reels = self._parse_text_metadata(filepath)
+        else:
+            reels = self._parse_xml_metadata(filepath, config['tags'])
+        if key is not None:
+            self._meta_cache[key] = reels
+        return reels
+
     def _parse_xml_metadata(self, filepath, tags):
-        """解析XML元数据"""
+        """流式解析XML元数据（单遍扫描，峰值内存与树深成正比）"""
         reel_numbers = set()
+        tag_set = set(tags)
         try:
-            tree = ET.parse(filepath)
-            root = tree.getroot()
-            for tag in tags:
-                for elem in root.iter(tag):
-                    if elem.text:
-                        match = REEL_PATTERN.search(elem.text)
-                        if match:
-                            reel_numbers.add(match.group(1))
-                            self.log(f"从{tag}提取卷号: {match.group(1)}")
+            for _, elem in ET.iterparse(filepath, events=('end',)):
+                # 去掉命名空间前缀，带命名空间的标签（如Sony）同样能匹配
+                tag = elem.tag.rsplit('}', 1)[-1]
+                if tag in tag_set and elem.text:
+                    match = REEL_PATTERN.search(elem.text)
+                    if match:
+                        reel_numbers.add(match.group(1))
+                        self.log(f"从{tag}提取卷号: {match.group(1)}")
+                elem.clear()
         except Exception as e:
             self.log(f"解析{filepath.name}错误: {e}")
         return reel_numbers
     
     def _parse_text_metadata(self, filepath):
-        """解析文本元数据"""
+        """解析文本元数据（mmap+字节regex，免去整文件解码）"""
         reel_numbers = set()
         try:
-            with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
-                content = f.read()
-                matches = REEL_PATTERN.findall(content)
-                for match in matches:
-                    reel_numbers.add(match)
-                    self.log(f"从元数据提取卷号: {match}")
+            with open(filepath, 'rb') as f:
+                # 提示内核顺序预读，减少慢速读卡器的往返次数
+                if hasattr(os, 'posix_fadvise'):
+                    os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+                try:
+                    buf = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                except ValueError:
+                    return reel_numbers  # 空文件无法mmap
+                try:
+                    for match in REEL_PATTERN_BYTES.findall(buf):
+                        reel = match.decode('ascii')
+                        reel_numbers.add(reel)
+                        self.log(f"从元数据提取卷号: {reel}")
+                finally:
+                    buf.close()
         except Exception as e:
             self.log(f"解析{filepath.name}错误: {e}")
         return reel_numbers
     
+    def _match_video(self, name, reels):
+        """判断文件名是否为视频素材，匹配则记录卷号，返回是否命中"""
+        if name.startswith('.'):
+            return False
+        if (name[-4:].lower() not in VIDEO_SUFFIXES_4
+                and name[-5:].lower() not in VIDEO_SUFFIXES_5):
+            return False
+        # 卷号前缀格式固定（1大写字母+3数字），纯字符串判断即可，省去regex开销
+        if (self._names_need_reels and len(name) >= 4
+                and 'A' <= name[0] <= 'Z' and name[1:4].isdigit()):
+            reels.add(name[:4])
+        return True
+
+    def _scan_subtree(self, path):
+        """扫描单个子目录树，返回(视频数, 示例文件名, 卷号集合, 无权限目录列表)"""
+        count = 0
+        sample = []
+        reels = set()
+        denied = []
+        streak = 0
+        match_video = self._match_video  # 热循环内避免重复属性查找
+        for entry in iter_files(path, on_error=denied.append):
+            before = len(reels)
+            if match_video(entry.name, reels):
+                count += 1
+                if len(sample) < VIDEO_SAMPLE_LIMIT:
+                    sample.append(entry.name)
+            # 快速模式：卷号集合长时间无变化（或元数据已给出卷号）时提前结束本子树
+            if self._fast_mode and (reels or not self._names_need_reels):
+                if len(reels) > before:
+                    streak = 0
+                else:
+                    streak += 1
+                    if streak > FAST_SCAN_STREAK:
+                        break
+        return count, sample, reels, denied
+
     def _scan_volumes(self):
-        """扫描存储卷"""
+        """扫描存储卷（挂载表未变化时复用缓存）"""
+        try:
+            mtime = os.stat("/Volumes").st_mtime_ns
+        except OSError:
+            mtime = None
+        if mtime is not None and mtime == self._vols_cache[0]:
+            return dict(self._vols_cache[1])
+
         volumes = {}
         try:
-            for item in Path("/Volumes").iterdir():
-                if item.is_dir() and item.name != "Macintosh HD":
-                    volumes[item.name] = str(item)
+            with os.scandir("/Volumes") as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False) and entry.name != "Macintosh HD":
+                        volumes[entry.name] = entry.path
         except Exception as e:
             self.log(f"扫描存储卷错误: {e}")
+        self._vols_cache = (mtime, volumes)
+        # 挂载表变化后卷名与磁盘标识符的对应关系可能失效
+        self._disk_id_cache.clear()
+        # 淘汰已卸载卷的元数据缓存
+        prefixes = tuple(path + '/' for path in volumes.values())
+        self._meta_cache = {key: reels for key, reels in self._meta_cache.items()
+                            if key[0].startswith(prefixes)}
         return volumes
     
     def refresh_volumes(self):
@@ -569,6 +822,8 @@ class CardRenamerApp:
         """后台刷新"""
         self.volume_paths = self._scan_volumes()
         volumes = list(self.volume_paths.keys())
+        # 顺带预取磁盘标识符，使重命名回退路径无需再起subprocess
+        self._load_disk_identifiers()
         
         def update_ui():
             self.volume_combo['values'] = volumes
@@ -585,7 +840,8 @@ class CardRenamerApp:
     
     def on_volume_selected(self, event=None):
         """存储卡选择变更"""
-        self.video_files = []
+        self.video_file_count = 0
+        self.video_sample = []
         self.reel_numbers = set()
         self.reel_combo['values'] = []
         self.selected_reel.set("")
@@ -608,6 +864,8 @@ class CardRenamerApp:
         self.analyze_btn.config(state=tk.DISABLED)
         self.warning_label.config(text="")
         self.clear_log()
+        # 在主线程读取Tk变量，供后台扫描线程使用
+        self._fast_mode = self.fast_scan.get()
         
         threading.Thread(target=self._analyze_volume, daemon=True).start()
     
@@ -617,7 +875,8 @@ class CardRenamerApp:
         volume_path = Path(f"/Volumes/{volume_name}")
         
         self.log(f"分析: {volume_name}")
-        self.video_files = []
+        self.video_file_count = 0
+        self.video_sample = []
         self.reel_numbers = set()
         
         # 优先提取元数据
@@ -628,29 +887,63 @@ class CardRenamerApp:
             self.log(f"从元数据提取到 {len(metadata_reels)} 个卷号")
         else:
             self.log("未找到元数据文件，将从文件名提取")
+        # 元数据已给出卷号时，文件扫描只负责计数
+        self._names_need_reels = not metadata_reels
         
-        # 扫描视频文件
+        # 扫描视频文件（按顶层子目录并行）
         self.log("正在扫描视频文件...")
+        file_count = 0
+        sample = []
+        reels = set()
+        permission_denied = []
         try:
-            for root, _, files in os.walk(volume_path):
-                for file in files:
-                    if file.startswith('.'):
+            top_dirs = []
+            with os.scandir(volume_path) as it:
+                for entry in it:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            name = entry.name
+                            if name[0] != '.' and name not in SKIP_DIRS:
+                                top_dirs.append(entry.path)
+                            continue
+                    except OSError:
                         continue
-                    if Path(file).suffix.lower() in VIDEO_EXTENSIONS:
-                        self.video_files.append(file)
-                        match = REEL_PATTERN.match(file)
-                        if match:
-                            self.reel_numbers.add(match.group(1))
+                    if self._match_video(entry.name, reels):
+                        file_count += 1
+                        if len(sample) < VIDEO_SAMPLE_LIMIT:
+                            sample.append(entry.name)
+
+            if top_dirs:
+                # 线程数可在用户设置中用scan_workers覆盖
+                workers = self.settings.get('scan_workers') or min(8, (os.cpu_count() or 4) + 4)
+                max_workers = min(workers, len(top_dirs))
+                with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                    for sub_count, sub_sample, sub_reels, sub_denied in executor.map(
+                            self._scan_subtree, top_dirs):
+                        file_count += sub_count
+                        if len(sample) < VIDEO_SAMPLE_LIMIT:
+                            sample.extend(sub_sample[:VIDEO_SAMPLE_LIMIT - len(sample)])
+                        reels.update(sub_reels)
+                        permission_denied.extend(sub_denied)
         except PermissionError:
-            self.log("警告: 部分目录无权限")
+            permission_denied.append(str(volume_path))
         except Exception as e:
             self.log(f"错误: {e}")
+
+        self.video_file_count = file_count
+        self.video_sample = sample
+        self.reel_numbers.update(reels)
+        if permission_denied:
+            self.log("警告: 部分目录无权限")
         
-        self.log(f"找到 {len(self.video_files)} 个视频文件")
+        if self._fast_mode:
+            self.log(f"快速模式: 已扫描 {self.video_file_count} 个视频文件（卷号稳定后提前结束）")
+        else:
+            self.log(f"找到 {self.video_file_count} 个视频文件")
         duplicates = self.reel_numbers & self.reel_history
-        
+
         def update_ui():
-            self.video_count_label.config(text=f"视频文件: {len(self.video_files)} 个")
+            self.video_count_label.config(text=f"视频文件: {self.video_file_count} 个")
             
             if self.reel_numbers:
                 sorted_reels = sorted(self.reel_numbers)
@@ -671,8 +964,8 @@ class CardRenamerApp:
                 self.set_status("分析完成", busy=False)
             else:
                 self.log("未能提取卷号")
-                if self.video_files:
-                    self.log(f"示例: {self.video_files[0]}")
+                if self.video_sample:
+                    self.log(f"示例: {self.video_sample[0]}")
                 self.set_step(1, 'error')
                 self.set_status("未找到卷号", busy=False)
             
@@ -720,7 +1013,8 @@ class CardRenamerApp:
             volume_path = f"/Volumes/{old_name}"
             result = subprocess.run(
                 ['diskutil', 'rename', volume_path, new_name],
-                capture_output=True, text=True, timeout=30
+                stdout=subprocess.DEVNULL, stderr=subprocess.PIPE,
+                text=True, timeout=DISKUTIL_TIMEOUT
             )
             
             if result.returncode == 0:
@@ -731,7 +1025,8 @@ class CardRenamerApp:
                     self.log(f"尝试: {disk_id}")
                     result2 = subprocess.run(
                         ['diskutil', 'rename', disk_id, new_name],
-                        capture_output=True, text=True, timeout=30
+                        stdout=subprocess.DEVNULL, stderr=subprocess.PIPE,
+                        text=True, timeout=DISKUTIL_TIMEOUT
                     )
                     success = result2.returncode == 0
                     error_msg = result2.stderr if not success else ""
@@ -791,7 +1086,8 @@ class CardRenamerApp:
         try:
             result = subprocess.run(
                 ['diskutil', 'eject', f'/Volumes/{volume_name}'],
-                capture_output=True, text=True, timeout=30
+                stdout=subprocess.DEVNULL, stderr=subprocess.PIPE,
+                text=True, timeout=DISKUTIL_TIMEOUT
             )
             success = result.returncode == 0
             error_msg = result.stderr